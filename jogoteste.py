@@ -303,8 +303,14 @@ class Ball(pygame.sprite.Sprite):
 
 
 # Funções ---------------------------------------------------------------------------------------------------------------------
+# Textos já renderizados, por (fonte, texto, cor): o placar e as mensagens mudam pouco entre frames
+text_cache = {}
+
 def draw_text(text, font, color, x, y, surface, centered=True):
-    text_surface = font.render(text, True, color)
+    key = (font, text, color)
+    text_surface = text_cache.get(key)
+    if text_surface is None:
+        text_surface = text_cache[key] = font.render(text, True, color)
     if centered:
         text_rect = text_surface.get_rect(center=(x, y))
     else:
@@ -316,6 +322,16 @@ def title_screen():
     pulse_timer = 0  # For pulsing text effect
     pulse_max = 30  # Frames for one pulse cycle
     
+    # Every scale of the pulsing "Press ENTER to Start" text, rendered once instead of every frame
+    start_text = font.render("Pressione ENTER para Iniciar", True, WHITE)
+    pulse_frames = []
+    for i in range(pulse_max):
+        pulse_scale = 1 + 0.1 * math.sin(2 * math.pi * i / pulse_max)
+        start_rect = start_text.get_rect(center=(WIDTH//2, HEIGHT//2))
+        start_rect = start_rect.inflate(start_rect.width * (pulse_scale - 1), 
+                                     start_rect.height * (pulse_scale - 1))
+        pulse_frames.append((pygame.transform.scale(start_text, start_rect.size), start_rect))
+    
     while True:
         screen.fill(BLACK)
         
@@ -324,13 +340,7 @@ def title_screen():
             draw_text("Duelo de Jogadores", big_font, WHITE, WIDTH//2, HEIGHT//3, screen)
             
             # Pulsing "Press ENTER to Start" text
-            pulse_scale = 1 + 0.1 * math.sin(2 * math.pi * pulse_timer / pulse_max)
-            start_text = font.render("Pressione ENTER para Iniciar", True, WHITE)
-            start_rect = start_text.get_rect(center=(WIDTH//2, HEIGHT//2))
-            start_rect = start_rect.inflate(start_rect.width * (pulse_scale - 1), 
-                                         start_rect.height * (pulse_scale - 1))
-            screen.blit(pygame.transform.scale(start_text, start_rect.size), 
-                       start_rect)
+            screen.blit(*pulse_frames[pulse_timer])
             
             # Instructions prompt
             draw_text("Pressione I para Instruções", font, YELLOW, WIDTH//2, HEIGHT*2//3, screen)
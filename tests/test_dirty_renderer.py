@@ -0,0 +1,98 @@
+# The dirty-rect renderer has to leave exactly the pixels a full redraw leaves, on every frame of every level
+import json, os, runpy
+
+import pytest
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SEEDS = [1, 2, 3]
+MAX_TICKS = 60 * 60  # a minute of play per level
+
+
+@pytest.fixture(scope="module")
+def game(tmp_path_factory):
+    # The asset paths start with ProjetoFinal/, so run from a folder where that name points at the repo
+    folder = tmp_path_factory.mktemp("run")
+    os.symlink(REPO, folder / "ProjetoFinal")
+    cwd = os.getcwd()
+    os.chdir(folder)
+    os.environ["DUEL_HEADLESS"] = "1"
+    try:
+        namespace = runpy.run_path(os.path.join("ProjetoFinal", "Game"), run_name="duel")
+        # run_path hands back a copy of the globals; the functions use the real ones
+        module = namespace["run_level"].__globals__
+        module["player1_score"] = module["player2_score"] = 0
+        yield module
+    finally:
+        os.chdir(cwd)
+
+
+class ComparingRenderer:
+    # Draws each tick with both renderers into their own surfaces and notes the ticks where they differ
+    def __init__(self, game):
+        self.pygame = game["pygame"]
+        size = (game["WIDTH"], game["HEIGHT"])
+        self.dirty = game["DirtyRenderer"](self.pygame.Surface(size))
+        self.full = game["WindowRenderer"](self.pygame.Surface(size))
+        self.frames = 0
+        self.mismatches = []
+
+    def render(self, level):
+        # Dirty first: it is the one that has to see what the static layer redrew this frame
+        self.dirty.render(level)
+        self.full.render(level)
+        self.frames += 1
+        if self.pygame.image.tobytes(self.dirty.surface, "RGB") != self.pygame.image.tobytes(self.full.surface, "RGB"):
+            self.mismatches.append(level.ticks)
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("level_index", range(5))
+def test_dirty_renderer_matches_full_redraw(game, level_index, seed):
+    game["rng"].seed(seed)
+    player1, player2 = game["create_players"]()
+    level = game["LEVELS"][level_index](player1, player2)
+    renderer = ComparingRenderer(game)
+    try:
+        game["run_level"](level, game["BotController"](seed), renderer, max_ticks=MAX_TICKS, realtime=False)
+    finally:
+        player1.clear_bullets()
+        player2.clear_bullets()
+    assert renderer.frames > 0
+    assert renderer.mismatches == [], f"{len(renderer.mismatches)} of {renderer.frames} frames differ, first at tick {renderer.mismatches[0]}"
+
+
+def test_arena_reload_redraws_moved_walls(game, tmp_path):
+    # A wall moved in the JSON while the level runs: the static layer redraws only that area, and both renderers
+    # end up showing the new map
+    pygame = game["pygame"]
+    Level1 = game["Level1"]
+    original = Level1.ARENA
+    with open(original) as f:
+        data = json.load(f)
+    path = str(tmp_path / "arena.json")
+    with open(path, "w") as f:
+        json.dump(data, f)
+    Level1.use_arena(path)
+    try:
+        game["rng"].seed(1)
+        player1, player2 = game["create_players"]()
+        level = Level1(player1, player2)
+        renderer = ComparingRenderer(game)
+        controller = game["BotController"](1)
+        game["run_level"](level, controller, renderer, max_ticks=60, realtime=False)
+
+        data["obstacles"][4][0] = 200
+        with open(path, "w") as f:
+            json.dump(data, f)
+        level.reload_arena()
+        assert level.static.invalid and len(level.static.invalid) == 2
+        game["run_level"](level, controller, renderer, max_ticks=120, realtime=False)
+    finally:
+        player1.clear_bullets()
+        player2.clear_bullets()
+        Level1.use_arena(original)
+
+    fresh = pygame.Surface(level.static.surface.get_size())
+    level.draw_static(fresh)
+    assert pygame.image.tobytes(level.static.surface, "RGB") == pygame.image.tobytes(fresh, "RGB")
+    assert renderer.mismatches == [], f"{len(renderer.mismatches)} of {renderer.frames} frames differ"